@@ -55,13 +55,182 @@ def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
         
     return df
 
+def parse_sales_csv(content: bytes) -> pd.DataFrame:
+    """
+    Reads the raw uploaded bytes into a DataFrame.
+    """
+    try:
+        return pd.read_csv(io.BytesIO(content))
+    except Exception:
+        raise ValueError("Invalid CSV file.")
+
+def clean_sales_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Coerces dates/numbers on a normalized frame and drops unusable rows.
+    """
+    df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
+    df = df.dropna(subset=['ds'])
+    df['y'] = pd.to_numeric(df['y'], errors='coerce')
+    df = df.dropna(subset=['y'])
+    
+    if 'stock' in df.columns:
+        df['stock'] = pd.to_numeric(df['stock'], errors='coerce').fillna(0)
+        
+    return df
+
+def analyze_products(df: pd.DataFrame):
+    """
+    Intelligence Engine Analysis:
+    Returns (top_sellers, worst_sellers, stock_analysis) from the cleaned history.
+    """
+    # A. ANALISIS HISTORIS (Winners & Deadstock)
+    top_sellers = {}
+    worst_sellers = {}
+    
+    if 'product' in df.columns:
+        # Group by product
+        product_stats = df.groupby('product')['y'].agg(['sum', 'mean', 'count'])
+        product_stats = product_stats.sort_values('sum', ascending=False)
+        
+        top_sellers = product_stats['sum'].head(3).to_dict()
+        worst_sellers = product_stats['sum'].tail(3).sort_values().to_dict() # Deadstock
+    
+    # B. ANALISIS STOK (Safety Stock & ROP)
+    stock_analysis = []
+    if 'product' in df.columns and 'stock' in df.columns:
+        last_stock = df.sort_values('ds').groupby('product')['stock'].last()
+        
+        # Lead Time assumption (can be dynamic later, default 3 days)
+        LEAD_TIME_DAYS = 3 
+        
+        for product in product_stats.index:
+            current_stock = last_stock.get(product, 0)
+            avg_sales = product_stats.loc[product, 'mean']
+            
+            # Formula: Safety Stock = Z * StdDev * sqrt(LeadTime)
+            # Simplified: Safety Stock = (Max Daily Sales - Avg Daily Sales) * Lead Time
+            # Let's use a simpler heuristics for now: 50% of Lead Time Demand
+            safety_stock = int(avg_sales * LEAD_TIME_DAYS * 0.5)
+            reorder_point = int((avg_sales * LEAD_TIME_DAYS) + safety_stock)
+            
+            velocity = avg_sales
+            days_left = current_stock / velocity if velocity > 0 else 999
+            
+            # Logic Status
+            if current_stock <= 0:
+                 status = "STOCKOUT"
+                 action = "Urgent Restock"
+            elif current_stock < reorder_point:
+                 status = "CRITICAL"
+                 action = "Order Now"
+            elif days_left < 7:
+                 status = "WARNING"
+                 action = "Plan Order"
+            else:
+                 status = "SAFE"
+                 action = "Monitor"
+
+            stock_analysis.append({
+                "product": product,
+                "status": status,
+                "action": action,
+                "days_left": round(days_left),
+                "current_stock": int(current_stock),
+                "rop": reorder_point
+            })
+        
+        # Sort by urgency
+        stock_analysis = sorted(stock_analysis, key=lambda x: x['days_left'])[:10]
+        
+    return top_sellers, worst_sellers, stock_analysis
+
+def fit_sales_model(df: pd.DataFrame) -> Prophet:
+    """
+    Fits Prophet on the total daily sales trend.
+    """
+    df_total = df.groupby('ds')['y'].sum().reset_index()
+    
+    # Smart Seasonality Toggle
+    duration_days = (df_total['ds'].max() - df_total['ds'].min()).days
+    use_yearly = True if duration_days > 365 else False
+    use_weekly = True if duration_days > 14 else False
+    
+    model = Prophet(yearly_seasonality=use_yearly, weekly_seasonality=use_weekly, daily_seasonality=False)
+    model.fit(df_total)
+    return model
+
+def predict_sales(model: Prophet, horizon: int) -> list:
+    """
+    Predicts the next `horizon` days and returns chart rows.
+    """
+    future = model.make_future_dataframe(periods=horizon)
+    forecast = model.predict(future)
+    
+    result_chart = forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].tail(horizon)
+    return result_chart.to_dict(orient='records')
+
+def serialize_chart(result_chart_list: list) -> list:
+    """
+    Converts chart rows into JSON-safe dicts for the Prisma Json column.
+    """
+    serializable_chart = []
+    for row in result_chart_list:
+        serializable_chart.append({
+            "ds": row['ds'].isoformat() if hasattr(row['ds'], 'isoformat') else str(row['ds']),
+            "yhat": float(row['yhat']),
+            "yhat_lower": float(row['yhat_lower']),
+            "yhat_upper": float(row['yhat_upper'])
+        })
+    return serializable_chart
+
+async def save_forecast_history(filename: str, serializable_chart: list, top_sellers: dict, stock_analysis: list):
+    """
+    Persists the forecast to PredictionHistory. Never raises: history is best-effort.
+    """
+    try:
+         from app.core.db import db
+         
+         # Ensure connection
+         if not db.is_connected():
+             print("⚠️ DB Disconnected in Prophet Service. Attempting reconnect...")
+             await db.connect()
+
+         if db.is_connected():
+            # Prepare data 
+            full_storage_data = {
+                "chart": serializable_chart,
+                "best_sellers": top_sellers,
+                "stock_alerts": stock_analysis
+            }
+
+            # Sanitize filename to prevent GraphQL parsing errors
+            # Remove or replace special characters that break GraphQL queries
+            safe_filename = filename or "unknown.csv"
+            # Replace problematic characters with safe alternatives
+            import re
+            safe_filename = re.sub(r'[^\w\s\-\.]', '_', safe_filename)
+            # Remove multiple underscores/spaces
+            safe_filename = re.sub(r'[_\s]+', '_', safe_filename)
+            
+            # IMPORTANT: Prisma 'Json' type expects a Python Dictionary, not a string.
+            # It handles serialization automatically.
+            await db.predictionhistory.create(
+                data={
+                    "filename": safe_filename,
+                    "plotData": full_storage_data 
+                }
+            )
+            print("✅ History saved to Supabase successfully!")
+         else:
+             print("❌ Failed to connect to DB for saving history.")
+
+    except Exception as db_err:
+        print(f"❌ Failed to save history: {db_err}")
+
 async def generate_forecast(file: UploadFile, horizon: int = 30):
     try:
         content = await file.read()
-        try:
-            df = pd.read_csv(io.BytesIO(content))
-        except Exception:
-            raise ValueError("Invalid CSV file.")
+        df = parse_sales_csv(content)
             
         # 1. Flexible Mapping
         try:
@@ -70,94 +239,17 @@ async def generate_forecast(file: UploadFile, horizon: int = 30):
             raise HTTPException(status_code=400, detail=str(ve))
             
         # Data Cleaning
-        df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
-        df = df.dropna(subset=['ds'])
-        df['y'] = pd.to_numeric(df['y'], errors='coerce')
-        df = df.dropna(subset=['y'])
-        
-        if 'stock' in df.columns:
-            df['stock'] = pd.to_numeric(df['stock'], errors='coerce').fillna(0)
+        df = clean_sales_data(df)
         
         if len(df) < 10:
              raise HTTPException(status_code=400, detail="Data history too short. Please provide at least 10 rows.")
 
         # 2. INTELLIGENCE ENGINE ANALYSIS
-        
-        # A. ANALISIS HISTORIS (Winners & Deadstock)
-        top_sellers = {}
-        worst_sellers = {}
-        
-        if 'product' in df.columns:
-            # Group by product
-            product_stats = df.groupby('product')['y'].agg(['sum', 'mean', 'count'])
-            product_stats = product_stats.sort_values('sum', ascending=False)
-            
-            top_sellers = product_stats['sum'].head(3).to_dict()
-            worst_sellers = product_stats['sum'].tail(3).sort_values().to_dict() # Deadstock
-        
-        # B. ANALISIS STOK (Safety Stock & ROP)
-        stock_analysis = []
-        if 'product' in df.columns and 'stock' in df.columns:
-            last_stock = df.sort_values('ds').groupby('product')['stock'].last()
-            
-            # Lead Time assumption (can be dynamic later, default 3 days)
-            LEAD_TIME_DAYS = 3 
-            
-            for product in product_stats.index:
-                current_stock = last_stock.get(product, 0)
-                avg_sales = product_stats.loc[product, 'mean']
-                
-                # Formula: Safety Stock = Z * StdDev * sqrt(LeadTime)
-                # Simplified: Safety Stock = (Max Daily Sales - Avg Daily Sales) * Lead Time
-                # Let's use a simpler heuristics for now: 50% of Lead Time Demand
-                safety_stock = int(avg_sales * LEAD_TIME_DAYS * 0.5)
-                reorder_point = int((avg_sales * LEAD_TIME_DAYS) + safety_stock)
-                
-                velocity = avg_sales
-                days_left = current_stock / velocity if velocity > 0 else 999
-                
-                # Logic Status
-                if current_stock <= 0:
-                     status = "STOCKOUT"
-                     action = "Urgent Restock"
-                elif current_stock < reorder_point:
-                     status = "CRITICAL"
-                     action = "Order Now"
-                elif days_left < 7:
-                     status = "WARNING"
-                     action = "Plan Order"
-                else:
-                     status = "SAFE"
-                     action = "Monitor"
-
-                stock_analysis.append({
-                    "product": product,
-                    "status": status,
-                    "action": action,
-                    "days_left": round(days_left),
-                    "current_stock": int(current_stock),
-                    "rop": reorder_point
-                })
-            
-            # Sort by urgency
-            stock_analysis = sorted(stock_analysis, key=lambda x: x['days_left'])[:10]
+        top_sellers, worst_sellers, stock_analysis = analyze_products(df)
 
         # C. FORECASTING (Total Sales Trend)
-        df_total = df.groupby('ds')['y'].sum().reset_index()
-        
-        # Smart Seasonality Toggle
-        duration_days = (df_total['ds'].max() - df_total['ds'].min()).days
-        use_yearly = True if duration_days > 365 else False
-        use_weekly = True if duration_days > 14 else False
-        
-        model = Prophet(yearly_seasonality=use_yearly, weekly_seasonality=use_weekly, daily_seasonality=False)
-        model.fit(df_total)
-
-        future = model.make_future_dataframe(periods=horizon)
-        forecast = model.predict(future)
-        
-        result_chart = forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].tail(horizon)
-        result_chart_list = result_chart.to_dict(orient='records')
+        model = fit_sales_model(df)
+        result_chart_list = predict_sales(model, horizon)
         
         # Calculate Summary Stats for Dashboard Cards
         total_inventory_items = int(df['stock'].sum()) if 'stock' in df.columns else 0
@@ -177,55 +269,13 @@ async def generate_forecast(file: UploadFile, horizon: int = 30):
             "forecast_chart": result_chart_list
         }
 
-        # Save History to Supabase
+        # Save History to Supabase (best-effort: never fail a finished forecast)
         try:
-             from app.core.db import db
-             
-             # Ensure connection
-             if not db.is_connected():
-                 print("⚠️ DB Disconnected in Prophet Service. Attempting reconnect...")
-                 await db.connect()
-
-             if db.is_connected():
-                # Prepare data 
-                serializable_chart = []
-                for row in result_chart_list:
-                    serializable_chart.append({
-                        "ds": row['ds'].isoformat() if hasattr(row['ds'], 'isoformat') else str(row['ds']),
-                        "yhat": float(row['yhat']),
-                        "yhat_lower": float(row['yhat_lower']),
-                        "yhat_upper": float(row['yhat_upper'])
-                    })
-                
-                full_storage_data = {
-                    "chart": serializable_chart,
-                    "best_sellers": top_sellers,
-                    "stock_alerts": stock_analysis
-                }
-
-                # Sanitize filename to prevent GraphQL parsing errors
-                # Remove or replace special characters that break GraphQL queries
-                safe_filename = file.filename or "unknown.csv"
-                # Replace problematic characters with safe alternatives
-                import re
-                safe_filename = re.sub(r'[^\w\s\-\.]', '_', safe_filename)
-                # Remove multiple underscores/spaces
-                safe_filename = re.sub(r'[_\s]+', '_', safe_filename)
-                
-                # IMPORTANT: Prisma 'Json' type expects a Python Dictionary, not a string.
-                # It handles serialization automatically.
-                await db.predictionhistory.create(
-                    data={
-                        "filename": safe_filename,
-                        "plotData": full_storage_data 
-                    }
-                )
-                print("✅ History saved to Supabase successfully!")
-             else:
-                 print("❌ Failed to connect to DB for saving history.")
-
-        except Exception as db_err:
-            print(f"❌ Failed to save history: {db_err}")
+            serializable_chart = serialize_chart(result_chart_list)
+        except Exception as ser_err:
+            print(f"❌ Failed to save history: {ser_err}")
+        else:
+            await save_forecast_history(file.filename, serializable_chart, top_sellers, stock_analysis)
         
         return response_data
 
@@ -0,0 +1,7 @@
+"""
+Gudangku backend benchmark suite.
+
+Run from the be/ directory:
+    python -m benchmarks run
+    python -m benchmarks compare benchmarks/results/<old>.json benchmarks/results/<new>.json
+"""
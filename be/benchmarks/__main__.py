@@ -0,0 +1,154 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import sys
+
+from benchmarks import results as bench_results
+from benchmarks.synthetic import generate_sales_csv
+
+def _data_args(parser: argparse.ArgumentParser):
+    parser.add_argument("--skus", type=int, default=20, help="number of products")
+    parser.add_argument("--days", type=int, default=365, help="days of history per product")
+    parser.add_argument("--noise", type=float, default=0.2, help="multiplicative noise std-dev")
+    parser.add_argument("--seasonality", type=float, default=0.3, help="weekly/yearly cycle amplitude")
+    parser.add_argument("--seed", type=int, default=42)
+
+def _data_kwargs(args) -> dict:
+    return {"skus": args.skus, "days": args.days, "noise": args.noise, "seasonality": args.seasonality, "seed": args.seed}
+
+def _progress(msg: str):
+    # stderr, so it survives the stdout redirect in cmd_run
+    print(msg, file=sys.stderr, flush=True)
+
+async def _run(args) -> dict:
+    # Fakes must be wired before any app module touches app.core.db
+    from benchmarks.fakes import install_fakes
+    from benchmarks.stages import time_forecast_stages, time_services
+
+    fake_db = install_fakes(llm_latency=args.llm_latency_ms / 1000, db_latency=args.db_latency_ms / 1000)
+    fake_db.seed(forecasts=args.seed_history, chats=args.seed_history)
+    await fake_db.connect()
+
+    content = generate_sales_csv(**_data_kwargs(args))
+
+    _progress(f"📦 Synthetic CSV: {args.skus} SKUs x {args.days} days ({len(content) / 1024:.0f} KiB)")
+    _progress("⏱️ Timing forecast stages...")
+    stages = await time_forecast_stages(content, horizon=args.horizon, repeat=args.repeat, warmup=args.warmup)
+    _progress("⏱️ Timing service entry points...")
+    services = await time_services(content, horizon=args.horizon, repeat=args.repeat, warmup=args.warmup)
+
+    load = None
+    if not args.skip_load:
+        from benchmarks.load import run_load_test
+        _progress(f"🚦 Load test: {args.forecast_clients} forecast + {args.chat_clients} chat clients...")
+        load = await run_load_test(
+            content,
+            horizon=args.horizon,
+            forecast_clients=args.forecast_clients,
+            chat_clients=args.chat_clients,
+            requests_per_client=args.requests,
+        )
+
+    return {"forecast_stages": stages, "services": services, "load": load}
+
+def _quiet_model_logs():
+    """
+    cmdstanpy installs its own INFO handler on the first fit unless its logger
+    already has one, which would undo a plain setLevel. A NullHandler counts as
+    a handler, so the logger stays quiet.
+    """
+    for name in ("cmdstanpy", "prophet"):
+        logger = logging.getLogger(name)
+        logger.addHandler(logging.NullHandler())
+        logger.setLevel(logging.WARNING)
+
+def cmd_run(args) -> int:
+    env = bench_results.collect_environment()
+
+    # Prophet/cmdstanpy and the services print a lot; keep it out of the timings' way
+    if not args.verbose:
+        _quiet_model_logs()
+        with contextlib.redirect_stdout(io.StringIO()):
+            measured = asyncio.run(_run(args))
+    else:
+        measured = asyncio.run(_run(args))
+
+    params = {k: v for k, v in vars(args).items() if k not in ("func", "output", "verbose")}
+    payload = {
+        "schema_version": bench_results.SCHEMA_VERSION,
+        "environment": env,
+        "params": params,
+        **measured,
+    }
+    path = bench_results.write_results(payload, args.output or bench_results.default_output_path(env))
+
+    for stage, stats in measured["forecast_stages"]["stages"].items():
+        print(f"  {stage:<10} median {stats['median_ms']:>10.3f} ms   p95 {stats['p95_ms']:>10.3f} ms")
+    for name, stats in measured["services"].items():
+        print(f"  {name:<22} median {stats['median_ms']:>10.3f} ms")
+    if measured["load"]:
+        for name, stats in measured["load"]["endpoints"].items():
+            print(f"  load.{name:<8} {stats['throughput_rps']:>8.2f} rps   p95 {stats['p95_ms']:>10.3f} ms   errors {stats['errors']}")
+    print(f"✅ Results written to {path}")
+    return 0
+
+def cmd_compare(args) -> int:
+    base = bench_results.load_results(args.base)
+    head = bench_results.load_results(args.head)
+    rows, regressed = bench_results.compare_results(
+        base, head, threshold=args.threshold, min_delta_ms=args.min_delta_ms
+    )
+    print(f"base: {base['environment'].get('commit')}  head: {head['environment'].get('commit')}")
+    print(bench_results.format_comparison(rows))
+    if regressed:
+        print(f"❌ Regression above {args.threshold:.0%} and {args.min_delta_ms} ms detected.")
+        return 1
+    print("✅ No regressions.")
+    return 0
+
+def cmd_generate(args) -> int:
+    content = generate_sales_csv(**_data_kwargs(args))
+    with open(args.output, "wb") as f:
+        f.write(content)
+    print(f"✅ Wrote {args.output} ({args.skus} SKUs x {args.days} days)")
+    return 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Gudangku backend benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="time forecast stages, services and a concurrent load test")
+    _data_args(run)
+    run.add_argument("--horizon", type=int, default=30, help="forecast days")
+    run.add_argument("--repeat", type=int, default=20, help="measured iterations per benchmark")
+    run.add_argument("--warmup", type=int, default=1, help="discarded iterations per benchmark")
+    run.add_argument("--llm-latency-ms", type=float, default=800.0, help="fake Groq response latency")
+    run.add_argument("--db-latency-ms", type=float, default=5.0, help="fake DB round trip per query")
+    run.add_argument("--seed-history", type=int, default=100, help="pre-seeded forecasts and chats in the fake DB")
+    run.add_argument("--forecast-clients", type=int, default=2)
+    run.add_argument("--chat-clients", type=int, default=8)
+    run.add_argument("--requests", type=int, default=5, help="requests per load-test client")
+    run.add_argument("--skip-load", action="store_true")
+    run.add_argument("--output", help="results JSON path (default: benchmarks/results/<time>_<commit>.json)")
+    run.add_argument("--verbose", action="store_true")
+    run.set_defaults(func=cmd_run)
+
+    compare = sub.add_parser("compare", help="diff two results files, exit 1 on regression")
+    compare.add_argument("base")
+    compare.add_argument("head")
+    compare.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown (0.10 = 10%%)")
+    compare.add_argument("--min-delta-ms", type=float, default=1.0, help="allowed absolute slowdown per median")
+    compare.set_defaults(func=cmd_compare)
+
+    generate = sub.add_parser("generate", help="write a synthetic sales CSV")
+    _data_args(generate)
+    generate.add_argument("--output", default="synthetic_sales.csv")
+    generate.set_defaults(func=cmd_generate)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+import asyncio
+import os
+import sys
+import types
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+class FakeTable:
+    """
+    In-memory stand-in for a Prisma model client (db.chatlog, db.predictionhistory).
+    Supports the subset of the query API the services use.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.rows: List[SimpleNamespace] = []
+
+    async def _round_trip(self):
+        # Always yield so concurrent requests interleave like a real driver
+        await asyncio.sleep(self.latency)
+
+    def _filter(self, where: Optional[Dict[str, Any]]):
+        if not where:
+            return list(self.rows)
+        return [r for r in self.rows if all(getattr(r, k, None) == v for k, v in where.items())]
+
+    @staticmethod
+    def _order(rows, order: Optional[Dict[str, str]]):
+        if order:
+            for field, direction in reversed(list(order.items())):
+                rows.sort(key=lambda r: getattr(r, field), reverse=direction == "desc")
+        return rows
+
+    async def create(self, data: Dict[str, Any]):
+        await self._round_trip()
+        row = SimpleNamespace(
+            id=str(uuid.uuid4()),
+            createdAt=datetime.now(timezone.utc),
+            **data,
+        )
+        self.rows.append(row)
+        return row
+
+    async def find_many(self, where=None, order=None, take=None):
+        await self._round_trip()
+        rows = self._order(self._filter(where), order)
+        return rows[:take] if take is not None else rows
+
+    async def find_first(self, where=None, order=None):
+        rows = await self.find_many(where=where, order=order, take=1)
+        return rows[0] if rows else None
+
+    async def find_unique(self, where):
+        return await self.find_first(where=where)
+
+    async def count(self, where=None):
+        await self._round_trip()
+        return len(self._filter(where))
+
+class FakePrisma:
+    """
+    In-process replacement for the `db = Prisma()` client in app.core.db.
+    `latency` (seconds) is added to every query to mimic the Supabase round trip.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self._connected = False
+        self.predictionhistory = FakeTable(latency)
+        self.chatlog = FakeTable(latency)
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def connect(self):
+        self._connected = True
+
+    async def disconnect(self):
+        self._connected = False
+
+    def seed(self, forecasts: int = 0, chats: int = 0, plot_data: Optional[Dict[str, Any]] = None):
+        """
+        Pre-fills history so list/replay queries have realistic sizes.
+        """
+        now = datetime.now(timezone.utc)
+        plot_data = plot_data or {"chart": [], "best_sellers": {}, "stock_alerts": []}
+        for i in range(forecasts):
+            self.predictionhistory.rows.append(SimpleNamespace(
+                id=str(uuid.uuid4()),
+                filename=f"penjualan_{i}.csv",
+                plotData=plot_data,
+                createdAt=now - timedelta(minutes=i),
+            ))
+        for i in range(chats):
+            self.chatlog.rows.append(SimpleNamespace(
+                id=str(uuid.uuid4()),
+                question=f"Bagaimana kondisi stok barang nomor {i} minggu ini?",
+                answer="Operasional lancar.",
+                isHelpful=True,
+                createdAt=now - timedelta(minutes=i, seconds=30),
+            ))
+
+class FakeChatGroq:
+    """
+    Drop-in for langchain_groq.ChatGroq: sleeps `latency` seconds, echoes a canned answer.
+    """
+    latency = 0.0
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    async def ainvoke(self, prompt: str):
+        await asyncio.sleep(self.latency)
+        return SimpleNamespace(content=f"Operasional lancar. (prompt {len(prompt)} chars)")
+
+class FakeUploadFile:
+    """
+    Minimal UploadFile for calling the services directly (read() + filename).
+    """
+
+    def __init__(self, content: bytes, filename: str = "bench.csv"):
+        self.content = content
+        self.filename = filename
+
+    async def read(self) -> bytes:
+        return self.content
+
+def install_fakes(llm_latency: float = 0.0, db_latency: float = 0.0) -> FakePrisma:
+    """
+    Wires the fakes into the app. Must run BEFORE anything imports app.core.db,
+    so no Prisma engine, DATABASE_URL or Groq key is needed.
+    """
+    if "app.core.db" in sys.modules:
+        raise RuntimeError("app.core.db already imported; call install_fakes() first.")
+
+    os.environ.setdefault("GROQ_API_KEY", "bench-fake-key")
+
+    fake_db = FakePrisma(latency=db_latency)
+
+    async def connect_db():
+        if not fake_db.is_connected():
+            await fake_db.connect()
+
+    async def disconnect_db():
+        if fake_db.is_connected():
+            await fake_db.disconnect()
+
+    import app.core
+    db_module = types.ModuleType("app.core.db")
+    db_module.db = fake_db
+    db_module.connect_db = connect_db
+    db_module.disconnect_db = disconnect_db
+    sys.modules["app.core.db"] = db_module
+    app.core.db = db_module
+
+    from app.services import groq_service
+    groq_service.ChatGroq = type("FakeChatGroq", (FakeChatGroq,), {"latency": llm_latency})
+
+    return fake_db
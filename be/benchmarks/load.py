@@ -0,0 +1,76 @@
+import asyncio
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.stages import summarize
+
+async def _forecast_client(client: httpx.AsyncClient, content: bytes, horizon: int, requests: int, log: List):
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        try:
+            resp = await client.post(
+                f"/api/forecast/{horizon}",
+                files={"file": ("bench.csv", content, "text/csv")},
+            )
+            ok = resp.status_code == 200
+        except Exception:
+            ok = False
+        log.append(("forecast", time.perf_counter() - t0, ok))
+
+async def _chat_client(client: httpx.AsyncClient, requests: int, log: List):
+    for i in range(requests):
+        t0 = time.perf_counter()
+        try:
+            resp = await client.post(
+                "/api/chat",
+                data={"question": f"Stok mana yang kritis? (#{i})"},
+            )
+            ok = resp.status_code == 200
+        except Exception:
+            ok = False
+        log.append(("chat", time.perf_counter() - t0, ok))
+
+async def run_load_test(
+    content: bytes,
+    horizon: int = 30,
+    forecast_clients: int = 2,
+    chat_clients: int = 8,
+    requests_per_client: int = 5,
+) -> Dict:
+    """
+    Fires concurrent forecast + chat clients at the FastAPI app in-process (ASGI transport).
+    Each client sends its requests back to back; latency is per request, throughput over the whole run.
+    """
+    from app.main import app
+
+    log: List = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        tasks = [_forecast_client(client, content, horizon, requests_per_client, log) for _ in range(forecast_clients)]
+        tasks += [_chat_client(client, requests_per_client, log) for _ in range(chat_clients)]
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*tasks)
+        wall = time.perf_counter() - t0
+
+    endpoints = {}
+    for name in ("forecast", "chat"):
+        entries = [e for e in log if e[0] == name]
+        if not entries:
+            continue
+        endpoints[name] = {
+            "requests": len(entries),
+            "errors": sum(1 for e in entries if not e[2]),
+            "throughput_rps": round(len(entries) / wall, 3) if wall else 0.0,
+            **summarize([e[1] for e in entries]),
+        }
+
+    return {
+        "clients": {"forecast": forecast_clients, "chat": chat_clients},
+        "requests_per_client": requests_per_client,
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(log) / wall, 3) if wall else 0.0,
+        "endpoints": endpoints,
+    }
@@ -0,0 +1,124 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SCHEMA_VERSION = 1
+RESULTS_DIR = Path(__file__).parent / "results"
+TRACKED_PACKAGES = ("pandas", "numpy", "prophet", "fastapi", "httpx")
+
+def _git(*args) -> str:
+    try:
+        return subprocess.check_output(["git", *args], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return ""
+
+def collect_environment() -> Dict:
+    """
+    Everything needed to tell two result files apart (commit, interpreter, libs, host).
+    """
+    versions = {}
+    for pkg in TRACKED_PACKAGES:
+        try:
+            versions[pkg] = metadata.version(pkg)
+        except metadata.PackageNotFoundError:
+            versions[pkg] = None
+
+    return {
+        "commit": _git("rev-parse", "HEAD") or None,
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+    }
+
+def default_output_path(env: Dict) -> Path:
+    commit = (env.get("commit") or "nogit")[:10]
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return RESULTS_DIR / f"{stamp}_{commit}.json"
+
+def write_results(results: Dict, path: Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True, default=str))
+    return path
+
+def load_results(path) -> Dict:
+    data = json.loads(Path(path).read_text())
+    if data.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported schema_version {data.get('schema_version')!r}")
+    return data
+
+# Tail latencies from a few load-test samples are close to the max; report them, don't gate on them
+INFORMATIONAL_SUFFIXES = (".p95",)
+
+def _medians(results: Dict) -> Dict[str, float]:
+    """
+    Flattens every comparable metric into 'section.name' keys.
+    """
+    flat = {}
+    for stage, stats in results.get("forecast_stages", {}).get("stages", {}).items():
+        if "median_ms" in stats:
+            flat[f"stage.{stage}"] = stats["median_ms"]
+    for name, stats in results.get("services", {}).items():
+        if "median_ms" in stats:
+            flat[f"service.{name}"] = stats["median_ms"]
+    for name, stats in (results.get("load") or {}).get("endpoints", {}).items():
+        if "median_ms" in stats:
+            flat[f"load.{name}"] = stats["median_ms"]
+        if "p95_ms" in stats:
+            flat[f"load.{name}.p95"] = stats["p95_ms"]
+    return flat
+
+def compare_results(
+    base: Dict, head: Dict, threshold: float = 0.10, min_delta_ms: float = 1.0
+) -> Tuple[List[Dict], bool]:
+    """
+    Compares medians of two runs. A metric regresses only when head is slower than
+    base by more than `threshold` (0.10 = 10%) AND by more than `min_delta_ms`,
+    so jitter on sub-millisecond stages can't fail the gate. p95 rows are
+    informational. Returns (rows, any_regression).
+    """
+    if base.get("params") != head.get("params"):
+        print("⚠️ Runs used different parameters; deltas may not be meaningful.")
+
+    base_m, head_m = _medians(base), _medians(head)
+    rows = []
+    regressed = False
+    for key in sorted(set(base_m) | set(head_m)):
+        b, h = base_m.get(key), head_m.get(key)
+        change = (h - b) / b if b and h is not None else None
+        gated = not key.endswith(INFORMATIONAL_SUFFIXES)
+        is_regression = (
+            gated
+            and change is not None
+            and change > threshold
+            and h - b > min_delta_ms
+        )
+        regressed = regressed or is_regression
+        rows.append({
+            "metric": key,
+            "base_ms": b,
+            "head_ms": h,
+            "change": change,
+            "gated": gated,
+            "regression": is_regression,
+        })
+    return rows, regressed
+
+def format_comparison(rows: List[Dict]) -> str:
+    lines = [f"{'metric':<32} {'base ms':>12} {'head ms':>12} {'change':>9}"]
+    for r in rows:
+        base = f"{r['base_ms']:.3f}" if r["base_ms"] is not None else "-"
+        head = f"{r['head_ms']:.3f}" if r["head_ms"] is not None else "-"
+        change = f"{r['change']:+.1%}" if r["change"] is not None else "-"
+        flag = "  ❌" if r["regression"] else ("" if r["gated"] else "  (info)")
+        lines.append(f"{r['metric']:<32} {base:>12} {head:>12} {change:>9}{flag}")
+    return "\n".join(lines)
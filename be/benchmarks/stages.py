@@ -0,0 +1,124 @@
+import statistics
+import time
+from typing import Dict, List
+
+# Order matches generate_forecast
+FORECAST_STAGES = ("parse", "map", "clean", "stats", "fit", "predict", "serialize", "save")
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Reduces raw timings (seconds) to comparable stats in milliseconds.
+    """
+    ms = sorted(s * 1000 for s in samples)
+    if not ms:
+        return {"n": 0}
+    p95_index = max(0, int(round(0.95 * len(ms))) - 1)
+    return {
+        "n": len(ms),
+        "min_ms": round(ms[0], 3),
+        "median_ms": round(statistics.median(ms), 3),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p95_ms": round(ms[p95_index], 3),
+        "max_ms": round(ms[-1], 3),
+        "stdev_ms": round(statistics.stdev(ms), 3) if len(ms) > 1 else 0.0,
+    }
+
+async def time_forecast_stages(content: bytes, horizon: int = 30, repeat: int = 5, warmup: int = 1):
+    """
+    Runs the generate_forecast pipeline stage by stage on the same upload.
+    Returns {stage: summary} plus the row counts the run worked on.
+    """
+    from app.services import prophet_service as ps
+
+    samples: Dict[str, List[float]] = {stage: [] for stage in FORECAST_STAGES}
+    rows = {}
+
+    for i in range(warmup + repeat):
+        timings = {}
+
+        t0 = time.perf_counter()
+        df = ps.parse_sales_csv(content)
+        t1 = time.perf_counter()
+        timings["parse"] = t1 - t0
+        rows["raw"] = len(df)
+
+        df = ps.normalize_columns(df)
+        t2 = time.perf_counter()
+        timings["map"] = t2 - t1
+
+        df = ps.clean_sales_data(df)
+        t3 = time.perf_counter()
+        timings["clean"] = t3 - t2
+        rows["clean"] = len(df)
+
+        top_sellers, _, stock_analysis = ps.analyze_products(df)
+        t4 = time.perf_counter()
+        timings["stats"] = t4 - t3
+
+        model = ps.fit_sales_model(df)
+        t5 = time.perf_counter()
+        timings["fit"] = t5 - t4
+
+        chart = ps.predict_sales(model, horizon)
+        t6 = time.perf_counter()
+        timings["predict"] = t6 - t5
+
+        serializable_chart = ps.serialize_chart(chart)
+        t7 = time.perf_counter()
+        timings["serialize"] = t7 - t6
+
+        await ps.save_forecast_history("bench.csv", serializable_chart, top_sellers, stock_analysis)
+        t8 = time.perf_counter()
+        timings["save"] = t8 - t7
+
+        if i >= warmup:
+            for stage, seconds in timings.items():
+                samples[stage].append(seconds)
+
+    return {
+        "rows": rows,
+        "stages": {stage: summarize(samples[stage]) for stage in FORECAST_STAGES},
+    }
+
+async def time_async(fn, *args, repeat: int = 5, warmup: int = 1, **kwargs) -> Dict[str, float]:
+    samples = []
+    for i in range(warmup + repeat):
+        t0 = time.perf_counter()
+        await fn(*args, **kwargs)
+        if i >= warmup:
+            samples.append(time.perf_counter() - t0)
+    return summarize(samples)
+
+def time_sync(fn, *args, repeat: int = 5, warmup: int = 1, **kwargs) -> Dict[str, float]:
+    samples = []
+    for i in range(warmup + repeat):
+        t0 = time.perf_counter()
+        fn(*args, **kwargs)
+        if i >= warmup:
+            samples.append(time.perf_counter() - t0)
+    return summarize(samples)
+
+async def time_services(content: bytes, horizon: int = 30, repeat: int = 5, warmup: int = 1):
+    """
+    End-to-end timings of the public service entry points against the fakes.
+    """
+    from app.services import prophet_service as ps
+    from app.services.groq_service import ask_gudangku_ai
+    from app.services.history_service import get_combined_history
+    from benchmarks.fakes import FakeUploadFile
+
+    raw = ps.parse_sales_csv(content)
+
+    return {
+        # normalize_columns mutates headers in place, hence the copy
+        "normalize_columns": time_sync(lambda: ps.normalize_columns(raw.copy()), repeat=repeat, warmup=warmup),
+        "generate_forecast": await time_async(
+            lambda: ps.generate_forecast(FakeUploadFile(content, "bench.csv"), horizon=horizon),
+            repeat=repeat, warmup=warmup,
+        ),
+        "get_combined_history": await time_async(get_combined_history, repeat=repeat, warmup=warmup),
+        "ask_gudangku_ai": await time_async(
+            ask_gudangku_ai, "Barang apa yang harus saya restock minggu ini?",
+            repeat=repeat, warmup=warmup,
+        ),
+    }
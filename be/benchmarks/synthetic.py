@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+# Headers picked so normalize_columns maps them like a real warehouse export
+# (tanggal -> ds, terjual -> y, nama_barang -> product, stok -> stock)
+COLUMNS = ["tanggal", "nama_barang", "terjual", "stok"]
+
+def generate_sales_frame(
+    skus: int = 20,
+    days: int = 365,
+    noise: float = 0.2,
+    seasonality: float = 0.3,
+    seed: int = 42,
+    start: str = "2024-01-01",
+) -> pd.DataFrame:
+    """
+    Builds a deterministic long-format sales history (one row per SKU per day).
+    - noise: std-dev of the multiplicative gaussian noise (0.2 = +/-20%)
+    - seasonality: amplitude of the weekly + yearly cycles (0 = flat demand)
+    """
+    if skus < 1 or days < 1:
+        raise ValueError("skus and days must be >= 1")
+
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start=start, periods=days, freq="D")
+
+    # Per-SKU base demand (few winners, long tail of slow movers) and a mild trend
+    base = rng.lognormal(mean=2.5, sigma=0.8, size=skus)
+    trend = rng.normal(loc=0.0, scale=0.001, size=skus)
+
+    t = np.arange(days)
+    weekly = np.sin(2 * np.pi * dates.dayofweek.to_numpy() / 7)
+    yearly = np.sin(2 * np.pi * dates.dayofyear.to_numpy() / 365.25)
+    season = 1 + seasonality * (0.6 * weekly + 0.4 * yearly)
+
+    demand = base[:, None] * (1 + trend[:, None] * t[None, :]) * season[None, :]
+    demand *= 1 + rng.normal(loc=0.0, scale=noise, size=(skus, days))
+    sales = np.clip(np.rint(demand), 0, None).astype(int)
+
+    # Simple stock simulation: sell down, restock to 30 days of cover below 5 days
+    stock = np.zeros_like(sales)
+    level = np.rint(base * 30).astype(int)
+    reorder_at = np.rint(base * 5).astype(int)
+    for day in range(days):
+        level = np.maximum(level - sales[:, day], 0)
+        level = np.where(level < reorder_at, np.rint(base * 30).astype(int), level)
+        stock[:, day] = level
+
+    names = [f"Barang {i + 1:04d}" for i in range(skus)]
+    return pd.DataFrame({
+        COLUMNS[0]: np.tile(dates.strftime("%Y-%m-%d"), skus),
+        COLUMNS[1]: np.repeat(names, days),
+        COLUMNS[2]: sales.ravel(),
+        COLUMNS[3]: stock.ravel(),
+    })
+
+def generate_sales_csv(**kwargs) -> bytes:
+    """
+    Same as generate_sales_frame, encoded like an uploaded CSV file.
+    """
+    return generate_sales_frame(**kwargs).to_csv(index=False).encode("utf-8")
@@ -0,0 +1,197 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.fakes import FakeTable, FakeUploadFile
+from benchmarks.results import compare_results
+from benchmarks.stages import summarize
+
+def _run_results(stages=None, services=None, endpoints=None):
+    return {
+        "params": {"skus": 1},
+        "forecast_stages": {"stages": {k: {"median_ms": v} for k, v in (stages or {}).items()}},
+        "services": {k: {"median_ms": v} for k, v in (services or {}).items()},
+        "load": {"endpoints": endpoints or {}},
+    }
+
+# --- summarize ---
+
+def test_summarize_empty():
+    assert summarize([]) == {"n": 0}
+
+def test_summarize_converts_to_ms_and_picks_p95():
+    stats = summarize([i / 1000 for i in range(1, 21)])  # 1..20 ms
+    assert stats["n"] == 20
+    assert stats["min_ms"] == 1.0
+    assert stats["max_ms"] == 20.0
+    assert stats["median_ms"] == 10.5
+    assert stats["p95_ms"] == 19.0
+
+def test_summarize_single_sample():
+    stats = summarize([0.005])
+    assert stats["p95_ms"] == 5.0
+    assert stats["stdev_ms"] == 0.0
+
+# --- compare_results ---
+
+def test_compare_flags_relative_and_absolute_slowdown():
+    base = _run_results(services={"generate_forecast": 100.0})
+    head = _run_results(services={"generate_forecast": 120.0})
+    rows, regressed = compare_results(base, head, threshold=0.10, min_delta_ms=1.0)
+    assert regressed
+    assert rows[0]["regression"]
+
+def test_compare_ignores_small_absolute_jitter():
+    # +50% but only 0.1 ms: noise on a sub-millisecond stage
+    base = _run_results(stages={"serialize": 0.2})
+    head = _run_results(stages={"serialize": 0.3})
+    _, regressed = compare_results(base, head, threshold=0.10, min_delta_ms=1.0)
+    assert not regressed
+
+def test_compare_ignores_small_relative_change():
+    base = _run_results(stages={"fit": 1000.0})
+    head = _run_results(stages={"fit": 1050.0})
+    _, regressed = compare_results(base, head, threshold=0.10, min_delta_ms=1.0)
+    assert not regressed
+
+def test_compare_reports_p95_without_gating():
+    endpoints_base = {"chat": {"median_ms": 100.0, "p95_ms": 100.0}}
+    endpoints_head = {"chat": {"median_ms": 100.0, "p95_ms": 500.0}}
+    rows, regressed = compare_results(
+        _run_results(endpoints=endpoints_base), _run_results(endpoints=endpoints_head)
+    )
+    p95 = next(r for r in rows if r["metric"] == "load.chat.p95")
+    assert not p95["gated"]
+    assert not p95["regression"]
+    assert not regressed
+
+def test_compare_handles_missing_metrics():
+    base = _run_results(stages={"parse": 10.0})
+    head = _run_results(stages={"map": 10.0})
+    rows, regressed = compare_results(base, head)
+    by_metric = {r["metric"]: r for r in rows}
+    assert by_metric["stage.parse"]["head_ms"] is None
+    assert by_metric["stage.map"]["base_ms"] is None
+    assert all(r["change"] is None for r in rows)
+    assert not regressed
+
+# --- FakeTable ---
+
+def test_fake_table_order_take_and_filters():
+    table = FakeTable()
+    now = datetime.now(timezone.utc)
+    for i in range(5):
+        table.rows.append(SimpleNamespace(id=str(i), kind="a" if i % 2 else "b", createdAt=now + timedelta(seconds=i)))
+
+    async def scenario():
+        newest = await table.find_many(order={"createdAt": "desc"}, take=2)
+        oldest = await table.find_first(order={"createdAt": "asc"})
+        only_a = await table.count(where={"kind": "a"})
+        unique = await table.find_unique(where={"id": "3"})
+        missing = await table.find_unique(where={"id": "nope"})
+        return newest, oldest, only_a, unique, missing
+
+    newest, oldest, only_a, unique, missing = asyncio.run(scenario())
+    assert [r.id for r in newest] == ["4", "3"]
+    assert oldest.id == "0"
+    assert only_a == 2
+    assert unique.id == "3"
+    assert missing is None
+
+def test_fake_table_create_assigns_id_and_timestamp():
+    table = FakeTable()
+    row = asyncio.run(table.create(data={"question": "q", "answer": "a"}))
+    assert row.id and row.createdAt
+    assert table.rows == [row]
+
+# --- synthetic generator ---
+
+def test_generator_is_deterministic_per_seed():
+    pytest.importorskip("pandas")
+    from benchmarks.synthetic import generate_sales_csv, generate_sales_frame
+
+    assert generate_sales_csv(skus=5, days=30, seed=7) == generate_sales_csv(skus=5, days=30, seed=7)
+    assert generate_sales_csv(skus=5, days=30, seed=7) != generate_sales_csv(skus=5, days=30, seed=8)
+
+    df = generate_sales_frame(skus=4, days=10)
+    assert len(df) == 40
+    assert df["nama_barang"].nunique() == 4
+    assert (df["terjual"] >= 0).all() and (df["stok"] >= 0).all()
+
+def test_generator_output_maps_through_normalize_columns():
+    for module in ("pandas", "prophet", "fastapi"):
+        pytest.importorskip(module)
+    from benchmarks.synthetic import generate_sales_frame
+    from app.services.prophet_service import normalize_columns
+
+    df = normalize_columns(generate_sales_frame(skus=2, days=5))
+    assert sorted(df.columns) == ["ds", "product", "stock", "y"]
+
+# --- generate_forecast against the fakes ---
+
+@pytest.fixture(scope="module")
+def fake_db():
+    """
+    install_fakes() for this module only; everything it patches is restored on teardown.
+    """
+    for module in ("pandas", "prophet", "fastapi", "langchain_groq", "PyPDF2", "tenacity", "pydantic_settings"):
+        pytest.importorskip(module)
+    import app.core
+    from benchmarks.fakes import install_fakes
+
+    with pytest.MonkeyPatch.context() as mp:
+        # Settings are read when groq_service is imported
+        if "GROQ_API_KEY" not in os.environ:
+            mp.setenv("GROQ_API_KEY", "bench-fake-key")
+        from app.services import groq_service
+
+        # Record the originals (or their absence) so teardown puts them back,
+        # then clear app.core.db so install_fakes() can take its place
+        mp.setattr(groq_service, "ChatGroq", groq_service.ChatGroq)
+        mp.setattr(app.core, "db", None, raising=False)
+        mp.delattr(app.core, "db")
+        mp.setitem(sys.modules, "app.core.db", None)
+        mp.delitem(sys.modules, "app.core.db")
+
+        yield install_fakes()
+
+def test_generate_forecast_end_to_end(fake_db):
+    from app.services.prophet_service import generate_forecast, serialize_chart
+    from benchmarks.synthetic import generate_sales_csv
+
+    horizon = 14
+    before = len(fake_db.predictionhistory.rows)
+    upload = FakeUploadFile(generate_sales_csv(skus=5, days=60, seed=1), "penjualan (maret).csv")
+
+    result = asyncio.run(generate_forecast(upload, horizon=horizon))
+
+    assert set(result) == {"summary", "best_sellers", "worst_sellers", "stock_alerts", "forecast_chart"}
+    assert set(result["summary"]) == {"total_stock", "stockouts", "accuracy"}
+    assert len(result["best_sellers"]) == 3
+    assert len(result["forecast_chart"]) == horizon
+
+    saved = fake_db.predictionhistory.rows[before:]
+    assert len(saved) == 1
+    assert saved[0].filename == "penjualan_maret_.csv"
+    assert saved[0].plotData["chart"] == serialize_chart(result["forecast_chart"])
+    assert saved[0].plotData["stock_alerts"] == result["stock_alerts"]
+
+def test_generate_forecast_survives_history_serialization_error(fake_db, monkeypatch):
+    from app.services import prophet_service
+    from benchmarks.synthetic import generate_sales_csv
+
+    def broken(_):
+        raise TypeError("not serializable")
+
+    monkeypatch.setattr(prophet_service, "serialize_chart", broken)
+    before = len(fake_db.predictionhistory.rows)
+    upload = FakeUploadFile(generate_sales_csv(skus=3, days=30, seed=2), "penjualan.csv")
+
+    result = asyncio.run(prophet_service.generate_forecast(upload, horizon=7))
+
+    assert len(result["forecast_chart"]) == 7
+    assert len(fake_db.predictionhistory.rows) == before